@@ -5,11 +5,17 @@ Provides interactive CLI menu for configuration and management.
 import os
 import re
 import sys
+import signal
+import shutil
+import _thread
+import socket
 import time
-from pathlib import Path
+import queue
+import itertools
+import functools
 import psutil
 import threading
-from datetime import datetime
+from collections import Counter
 
 from prompt_toolkit import prompt
 from prompt_toolkit.shortcuts import clear
@@ -18,7 +24,15 @@ from prompt_toolkit.formatted_text import HTML
 from colorama import init, Fore, Style as ColorStyle
 
 # Initialize colorama for cross-platform colored terminal output
-init()
+if sys.stdout.isatty():
+    init()
+else:
+    # Output is piped or captured: resolve every color code to ""
+    class _NoColor:
+        def __getattr__(self, name):
+            return ""
+    
+    Fore = ColorStyle = _NoColor()
 
 from log_collector.config import (
     logger,
@@ -28,6 +42,77 @@ from log_collector.config import (
     DEFAULT_HEALTH_CHECK_INTERVAL,
 )
 
+# Color prefixes, resolved once instead of on every message
+_ERR = Fore.RED
+_OK = Fore.GREEN
+_WARN = Fore.YELLOW
+_INFO = Fore.CYAN
+_RST = ColorStyle.RESET_ALL
+
+# Frequently shown static messages
+_MSG_INVALID_CHOICE = f"{_ERR}Invalid choice. Please try again.{_RST}"
+_MSG_SOURCE_NOT_FOUND = f"{_ERR}Source not found.{_RST}"
+_MSG_INVALID_URL = f"{_ERR}Invalid URL. Please enter a valid URL starting with http:// or https://.{_RST}"
+_MSG_IP_IN_USE = f"{_ERR}This IP is already used by another source. Please enter a different IP.{_RST}"
+_MSG_INVALID_IP = f"{_ERR}Invalid IP address. Please enter a valid IPv4 address.{_RST}"
+_MSG_PORT_RANGE = f"{_ERR}Port must be between 1 and 65535.{_RST}"
+_MSG_INVALID_PORT = f"{_ERR}Invalid port. Please enter a valid number.{_RST}"
+_MSG_HEC_TOKEN_EMPTY = f"{_ERR}HEC token cannot be empty.{_RST}"
+_MSG_FOLDER_WRITABLE = f"{_OK}Folder is accessible and writable.{_RST}"
+_MSG_CHECK_PATH = f"{_WARN}Please ensure the path is valid and you have permission to create it.{_RST}"
+_MSG_CHECK_WRITE_PERMS = f"{_WARN}Please ensure you have write permissions to this folder.{_RST}"
+_MSG_RESTART_HINT = f"{_WARN}You may need to restart the application to fully apply changes.{_RST}"
+_MSG_CONTINUING = f"{_OK}Continuing...{_RST}"
+_MSG_GOODBYE = f"{_OK}Graceful shutdown completed. Goodbye!{_RST}"
+
+# Usage bars for the default width, indexed by number of filled cells
+_BAR_WIDTH = 20
+_BARS = tuple('█' * i + '░' * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+@functools.lru_cache(maxsize=128)
+def _build_bar(filled, width):
+    return '█' * filled + '░' * (width - filled)
+
+def _get_bar(percentage, width=_BAR_WIDTH):
+    """Get a text bar graph for a percentage."""
+    filled = min(max(int(width * percentage / 100), 0), width)
+    if width == _BAR_WIDTH:
+        return _BARS[filled]
+    return _build_bar(filled, width)
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=256)
+def _format_bytes(bytes_value):
+    """Format a byte count in human-readable form, e.g. "1.50 GB"."""
+    bytes_value = int(bytes_value)
+    unit = min(len(_BYTE_UNITS) - 1, (bytes_value.bit_length() - 1) // 10) if bytes_value > 0 else 0
+    return f"{bytes_value / (1 << (10 * unit)):.2f} {_BYTE_UNITS[unit]}"
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+@functools.lru_cache(maxsize=512)
+def _visible_width(line):
+    """Get the number of columns a line occupies, ignoring ANSI escapes."""
+    return len(_ANSI_RE.sub("", line))
+
+def _valid_ipv4(address):
+    """Check that a string is a dotted-quad IPv4 address."""
+    try:
+        socket.inet_pton(socket.AF_INET, address)
+        return True
+    except (OSError, ValueError):
+        return False
+
+# Menu prompts, parsed once rather than on every render
+_PROMPTS = {
+    "main_menu": HTML("<ansicyan>Choose an option (1-5): </ansicyan>"),
+    "manage_sources": HTML("<ansicyan>Choose an option: </ansicyan>"),
+    "manage_source": HTML("<ansicyan>Choose an option (1-3): </ansicyan>"),
+    "health_check_configured": HTML("<ansicyan>Choose an option (1-3): </ansicyan>"),
+    "health_check_unconfigured": HTML("<ansicyan>Choose an option (1-2): </ansicyan>"),
+}
+
 class CLI:
     """Command Line Interface for Log Collector."""
     
@@ -51,158 +136,328 @@ class CLI:
         })
 
         self.old_terminal_settings = None
+        
+        # Static screen text, rendered once and written in a single call
+        self._header_text = "\n".join([
+            f"{_INFO}======================================",
+            "         LOG COLLECTOR",
+            "======================================",
+            f"Version: 1.0.0{_RST}",
+            "",
+        ]) + "\n"
+        self._main_menu_text = "\n".join([
+            "",
+            "Main Menu:",
+            "1. Add New Source",
+            "2. Manage Sources",
+            "3. Health Check Configuration",
+            "4. View Status",
+            "5. Exit",
+        ]) + "\n"
+        
+        # Rendered source list for _manage_sources, rebuilt when the sources change
+        self._sources_listing = ""
+        self._sources_listing_version = None
+        
+        # Last frame written by _view_status, for redrawing only changed lines
+        self._prev_lines = None
+        
+        # Menus re-shown after invalid input skip the clear and header
+        self._need_full_clear = True
+        
+        # Set by the signal thread when Ctrl+C is received outside a prompt
+        self._request_exit = threading.Event()
+        
+        # Set by the signal thread on SIGTERM; the main thread shuts down
+        self._terminate = threading.Event()
+        
+        # Held by whichever thread runs the final shutdown (reentrant so the
+        # main thread can retry after an interrupted cleanup)
+        self._exit_lock = threading.RLock()
+        
+        # Set once the final shutdown has started
+        self._shutting_down = threading.Event()
+        
+        # Terminal attributes at startup, restored if the signal thread has
+        # to exit on its own while the terminal may be in raw mode
+        self._tty_attrs = None
+        
+        # Last system sample shown by _view_status, see _sample_system()
+        self._sys_cache = {"ts": 0.0, "disk_ts": 0.0, "cpu": 0.0, "mem": None, "disk": None, "net": None}
+        # (thread count, monotonic time sampled) for the status view
+        self._thread_count_cache = (0, 0.0)
+        # Prime cpu_percent so later non-blocking calls measure from here
+        psutil.cpu_percent(interval=None)
     
     def start(self):
         """Start CLI interface."""
         clear()
         self._print_header()
         
-        # Setup signal handler for clean exits
-        import signal
-        
-        def signal_handler(sig, frame):
-            print("\n\n")
-            print(f"{Fore.YELLOW}Ctrl+C detected. Do you want to exit?{ColorStyle.RESET_ALL}")
+        # Handle SIGINT/SIGTERM on a dedicated thread instead of in signal
+        # context. The mask must be set before any worker threads are started
+        # so they inherit it.
+        if hasattr(signal, "pthread_sigmask"):
             try:
-                confirm = prompt("Exit the application? (y/n): ")
-                if confirm.lower() == 'y':
-                    print(f"{Fore.CYAN}Cleaning up resources...{ColorStyle.RESET_ALL}")
-                    self._clean_exit()
-                    print(f"{Fore.GREEN}Graceful shutdown completed. Goodbye!{ColorStyle.RESET_ALL}")
-                    sys.exit(0)
-                else:
-                    print(f"{Fore.GREEN}Continuing...{ColorStyle.RESET_ALL}")
-                    return
-            except KeyboardInterrupt:
-                # If Ctrl+C is pressed during the prompt, exit immediately
-                print(f"\n{Fore.CYAN}Forced exit. Cleaning up resources...{ColorStyle.RESET_ALL}")
-                self._clean_exit()
-                print(f"{Fore.GREEN}Graceful shutdown completed. Goodbye!{ColorStyle.RESET_ALL}")
-                sys.exit(0)
-        
-        # Register the signal handler for SIGINT (Ctrl+C)
-        signal.signal(signal.SIGINT, signal_handler)
+                import termios
+                self._tty_attrs = termios.tcgetattr(sys.stdin.fileno())
+            except Exception:
+                self._tty_attrs = None
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
+            threading.Thread(target=self._signal_loop, daemon=True).start()
+        else:
+            # No sigwait on Windows; let Ctrl+C surface as KeyboardInterrupt
+            signal.signal(signal.SIGINT, signal.default_int_handler)
         
         # Start component threads if there are already sources configured
         sources = self.source_manager.get_sources()
         if sources:
             self.processor_manager.start()
             self.listener_manager.start()
-            print(f"{Fore.GREEN}Started with {len(sources)} configured sources.{ColorStyle.RESET_ALL}")
+            print(f"{_OK}Started with {len(sources)} configured sources.{_RST}")
         
         # Automatically start health check if configured
-        if hasattr(self.health_check, 'config') and self.health_check.config is not None:
+        if self.health_check.config is not None:
             if self.health_check.start():
-                print(f"{Fore.GREEN}Health check monitoring started automatically.{ColorStyle.RESET_ALL}")
+                print(f"{_OK}Health check monitoring started automatically.{_RST}")
             else:
-                print(f"{Fore.YELLOW}Health check is configured but failed to start.{ColorStyle.RESET_ALL}")
+                print(f"{_WARN}Health check is configured but failed to start.{_RST}")
         
         print("\nPress Enter to continue to main menu...")
-        input()
+        self._pause("")
         
         while True:
             try:
                 self._show_main_menu()
             except KeyboardInterrupt:
-                # This should not be reached due to the signal handler, but just in case
-                signal_handler(signal.SIGINT, None)
+                # Ctrl+C pressed while a prompt was active, or SIGTERM
+                # interrupting the main thread
+                if self._terminate.is_set():
+                    self._shutdown()
+                self._confirm_exit()
             except Exception as e:
-                print(f"{Fore.RED}Error: {e}{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
+                print(f"{_ERR}Error: {e}{_RST}")
+                self._pause()
+            
+            self._check_exit_request()
+    
+    def _signal_loop(self):
+        """Wait for SIGINT/SIGTERM and act on them outside signal context."""
+        while True:
+            sig = signal.sigwait({signal.SIGINT, signal.SIGTERM})
+            if sig == signal.SIGTERM:
+                if self._terminate.is_set():
+                    # Second SIGTERM: stop waiting for the clean shutdown
+                    logger.info("Received second termination signal, exiting immediately")
+                    self._restore_startup_terminal()
+                    os._exit(1)
+                
+                logger.info("Received termination signal, shutting down...")
+                self._terminate.set()
+                
+                # Raises KeyboardInterrupt in the main thread, which lets an
+                # active prompt_toolkit prompt restore the terminal on the way
+                # out. Skipped once shutdown runs, as it would abort the cleanup.
+                if not self._shutting_down.is_set():
+                    _thread.interrupt_main()
+                
+                # A main thread blocked in input() never sees the interrupt,
+                # so shut down from a timer if it has not taken over in time
+                timer = threading.Timer(2.0, self._shutdown_if_stalled)
+                timer.daemon = True
+                timer.start()
+                continue
+            self._request_exit.set()
+    
+    def _shutdown_if_stalled(self):
+        """Shut down after SIGTERM if the main thread has not started to."""
+        if self._exit_lock.acquire(blocking=False):
+            self._shutting_down.set()
+            self._restore_startup_terminal()
+            self._clean_exit()
+            os._exit(0)
+    
+    def _restore_startup_terminal(self):
+        """Put the terminal back into the mode it was in at startup."""
+        if self._tty_attrs is None:
+            return
+        try:
+            import termios
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._tty_attrs)
+        except Exception as e:
+            logger.error(f"Error restoring terminal: {e}")
+    
+    def _shutdown(self):
+        """Stop all services and exit the process.
+        
+        Only the first thread to call this shuts down. If the signal thread
+        already took over, the main thread gives it a few seconds to finish
+        and then forces the exit.
+        """
+        if not self._exit_lock.acquire(blocking=False):
+            time.sleep(10)
+            os._exit(1)
+        
+        self._shutting_down.set()
+        try:
+            self._clean_exit()
+        except KeyboardInterrupt:
+            # A SIGTERM interrupt raced with the start of shutdown; finish up
+            self._clean_exit()
+        print(_MSG_GOODBYE)
+        sys.exit(0)
+    
+    def _confirm_exit(self):
+        """Ask whether to exit after Ctrl+C and shut down if confirmed."""
+        print("\n\n")
+        print(f"{_WARN}Ctrl+C detected. Do you want to exit?{_RST}")
+        try:
+            # prompt() rather than _confirm(): with SIGINT masked, only a
+            # prompt_toolkit prompt turns a second Ctrl+C into KeyboardInterrupt
+            confirm = prompt("Exit the application? (y/n): ")
+            if confirm.lower() == 'y':
+                print(f"{_INFO}Cleaning up resources...{_RST}")
+                self._shutdown()
+            else:
+                print(_MSG_CONTINUING)
+                self._need_full_clear = True
+                return
+        except KeyboardInterrupt:
+            # If Ctrl+C is pressed during the prompt, exit immediately
+            print(f"\n{_INFO}Forced exit. Cleaning up resources...{_RST}")
+            self._shutdown()
+    
+    def _write(self, text):
+        """Write a block of text to stdout in one call and flush it."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    
+    def _check_exit_request(self):
+        """Act on a SIGTERM or Ctrl+C received while input() was blocking.
+        
+        Returns:
+            bool: True if an exit was requested and the user chose to continue
+        """
+        if self._terminate.is_set():
+            self._shutdown()
+        if not self._request_exit.is_set():
+            return False
+        self._request_exit.clear()
+        self._confirm_exit()
+        return True
+    
+    def _pause(self, message="Press Enter to continue..."):
+        """Wait for Enter, then handle any Ctrl+C pressed meanwhile."""
+        input(message)
+        self._check_exit_request()
+    
+    def _confirm(self, message):
+        """Read a plain one-line answer, skipping prompt_toolkit's setup.
+        
+        A Ctrl+C while waiting cancels the question.
+        
+        Returns:
+            str: The answer, stripped and lower-cased
+        """
+        answer = input(message).strip().lower()
+        if self._check_exit_request():
+            return ""
+        return answer
     
     def _print_header(self):
         """Print application header."""
-        print(f"{Fore.CYAN}======================================")
-        print("         LOG COLLECTOR")
-        print("======================================")
-        print(f"Version: 1.0.0{ColorStyle.RESET_ALL}")
-        print()
+        self._write(self._header_text)
+    
+    def _begin_render(self):
+        """Clear the screen if a full repaint is due.
+        
+        Returns:
+            str: Header text to prefix the menu with, or "" when the menu is
+            only being re-shown below the previous output.
+        """
+        if not self._need_full_clear:
+            return ""
+        clear()
+        self._need_full_clear = False
+        return self._header_text
+    
+    def _open_screen(self, handler, *args):
+        """Run a sub-screen, forcing a full repaint on entry and on return."""
+        self._need_full_clear = True
+        try:
+            return handler(*args)
+        finally:
+            self._need_full_clear = True
     
     def _show_main_menu(self):
         """Display main menu and handle commands."""
-        clear()  # Ensure screen is cleared
-        self._print_header()
-        print("\nMain Menu:")
-        print("1. Add New Source")
-        print("2. Manage Sources")
-        print("3. Health Check Configuration")
-        print("4. View Status")
-        print("5. Exit")
+        # Saves happen in the background, so surface a failed one here
+        save_error = self.source_manager.save_error
+        warning = f"{_ERR}{save_error}{_RST}\n" if save_error else ""
+        self._write(self._begin_render() + warning + self._main_menu_text)
         
         choice = prompt(
-            HTML("<ansicyan>Choose an option (1-5): </ansicyan>"),
+            _PROMPTS["main_menu"],
             style=self.prompt_style
         )
         
         if choice == "1":
-            self._add_source()
+            self._open_screen(self._add_source)
         elif choice == "2":
-            self._manage_sources()
+            self._open_screen(self._manage_sources)
         elif choice == "3":
-            self._configure_health_check()
+            self._open_screen(self._configure_health_check)
         elif choice == "4":
-            self._view_status()
+            self._open_screen(self._view_status)
         elif choice == "5":
-            self._exit_application()
+            self._open_screen(self._exit_application)
             # If we return here, it means the user canceled the exit
             return
         else:
-            print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
+            print(_MSG_INVALID_CHOICE)
     
 
     def _add_source(self):
         """Add a new log source."""
         clear()
         self._print_header()
-        print(f"{Fore.CYAN}=== Add New Source ==={ColorStyle.RESET_ALL}")
+        print(f"{_INFO}=== Add New Source ==={_RST}")
         
         source_data = {}
         
         # Get source name
         source_data["source_name"] = prompt("Source Name: ")
         if not source_data["source_name"]:
-            print(f"{Fore.RED}Source name cannot be empty.{ColorStyle.RESET_ALL}")
-            input("Press Enter to continue...")
+            print(f"{_ERR}Source name cannot be empty.{_RST}")
+            self._pause()
             return
         
         # Get source IP
-        ip_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-        
-        # Check if IP already exists in any source
-        existing_ips = [src["source_ip"] for src in self.source_manager.get_sources().values()]
-        
         while True:
             source_data["source_ip"] = prompt("Source IP: ")
             
             # Check if the IP is already in use
-            if source_data["source_ip"] in existing_ips:
-                print(f"{Fore.RED}This IP is already used by another source. Please enter a different IP.{ColorStyle.RESET_ALL}")
+            if self.source_manager.has_ip(source_data["source_ip"]):
+                print(_MSG_IP_IN_USE)
                 continue
                 
-            if re.match(ip_pattern, source_data["source_ip"]):
-                # Validate each octet
-                octets = [int(octet) for octet in source_data["source_ip"].split(".")]
-                if all(0 <= octet <= 255 for octet in octets):
-                    break
-            print(f"{Fore.RED}Invalid IP address. Please enter a valid IPv4 address.{ColorStyle.RESET_ALL}")
+            if _valid_ipv4(source_data["source_ip"]):
+                break
+            print(_MSG_INVALID_IP)
         
         # Get listener port
         while True:
-            port = prompt("Listener Port [514]: ")
-            try:
-                if not port:  # If user just presses Enter, use 514 as default
-                    port = 514
-                    source_data["listener_port"] = port
-                    break
-                else:
-                    port = int(port)
-                    if 1 <= port <= 65535:
-                        source_data["listener_port"] = port
-                        break
-                    else:
-                        print(f"{Fore.RED}Port must be between 1 and 65535.{ColorStyle.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid port. Please enter a valid number.{ColorStyle.RESET_ALL}")
+            port = prompt("Listener Port [514]: ").strip()
+            if not port:  # If user just presses Enter, use 514 as default
+                source_data["listener_port"] = 514
+                break
+            elif not port.isdecimal():
+                print(_MSG_INVALID_PORT)
+            elif 1 <= int(port) <= 65535:
+                source_data["listener_port"] = int(port)
+                break
+            else:
+                print(_MSG_PORT_RANGE)
         
         # Get protocol - simplified to accept single letter with UDP as default
         protocol = prompt("Protocol (u-UDP, t-TCP) [UDP]: ")
@@ -221,42 +476,37 @@ class CLI:
             elif target_type.lower() == 'h':
                 source_data["target_type"] = "HEC"
                 break
-            print(f"{Fore.RED}Invalid target type. Please enter f for Folder or h for HEC.{ColorStyle.RESET_ALL}")
+            print(f"{_ERR}Invalid target type. Please enter f for Folder or h for HEC.{_RST}")
         
         # Get target-specific settings
         if source_data["target_type"] == "FOLDER":
             # Get folder path with improved guidance
-            print(f"\n{Fore.CYAN}Folder Path Examples:{ColorStyle.RESET_ALL}")
+            print(f"\n{_INFO}Folder Path Examples:{_RST}")
             print("  - Local folder: C:\\logs\\collector")
             print("  - Network share: \\\\server\\share\\logs")
             print("  - Linux path: /var/log/collector")
             
             while True:
                 folder_path = prompt("\nFolder Path: ")
-                path = Path(folder_path)
                 
                 # First check if the path exists
-                if not path.exists():
+                if not os.path.isdir(folder_path):
                     try:
-                        os.makedirs(path, exist_ok=True)
-                        print(f"{Fore.GREEN}Created folder: {path}{ColorStyle.RESET_ALL}")
+                        os.makedirs(folder_path, exist_ok=True)
+                        print(f"{_OK}Created folder: {folder_path}{_RST}")
                     except Exception as e:
-                        print(f"{Fore.RED}Error creating folder: {e}{ColorStyle.RESET_ALL}")
-                        print(f"{Fore.YELLOW}Please ensure the path is valid and you have permission to create it.{ColorStyle.RESET_ALL}")
+                        print(f"{_ERR}Error creating folder: {e}{_RST}")
+                        print(_MSG_CHECK_PATH)
                         continue
                 
                 # Check if folder is writable
-                try:
-                    test_file = path / ".test_write_access"
-                    with open(test_file, "w") as f:
-                        f.write("test")
-                    os.remove(test_file)
-                    source_data["folder_path"] = str(path)
-                    print(f"{Fore.GREEN}Folder is accessible and writable.{ColorStyle.RESET_ALL}")
+                write_check = self.source_manager.check_folder_writable(folder_path)
+                if write_check["valid"]:
+                    source_data["folder_path"] = os.path.abspath(folder_path)
+                    print(_MSG_FOLDER_WRITABLE)
                     break
-                except Exception as e:
-                    print(f"{Fore.RED}Folder is not writable: {e}{ColorStyle.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Please ensure you have write permissions to this folder.{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}{write_check['error']}{_RST}")
+                print(_MSG_CHECK_WRITE_PERMS)
             
             # Get batch size
             batch_size = prompt(f"Batch Size [{DEFAULT_FOLDER_BATCH_SIZE}]: ")
@@ -272,13 +522,13 @@ class CLI:
                 if hec_url.startswith(("http://", "https://")):
                     source_data["hec_url"] = hec_url
                     break
-                print(f"{Fore.RED}Invalid URL. Please enter a valid URL starting with http:// or https://.{ColorStyle.RESET_ALL}")
+                print(_MSG_INVALID_URL)
             
             # Get HEC token
             hec_token = prompt("HEC Token: ")
             if not hec_token:
-                print(f"{Fore.RED}HEC token cannot be empty.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
+                print(_MSG_HEC_TOKEN_EMPTY)
+                self._pause()
                 return
             source_data["hec_token"] = hec_token
             
@@ -290,62 +540,66 @@ class CLI:
                 source_data["batch_size"] = DEFAULT_HEC_BATCH_SIZE
         
         # Add the source
-        print(f"\n{Fore.CYAN}Validating source configuration...{ColorStyle.RESET_ALL}")
+        print(f"\n{_INFO}Validating source configuration...{_RST}")
         result = self.source_manager.add_source(source_data)
         
         if result["success"]:
-            print(f"{Fore.GREEN}Source added successfully with ID: {result['source_id']}{ColorStyle.RESET_ALL}")
+            print(f"{_OK}Source added successfully with ID: {result['source_id']}{_RST}")
             
-            # Start newly added source by completely restarting the services
-            print(f"\n{Fore.CYAN}Starting newly added source...{ColorStyle.RESET_ALL}")
+            # Start only the new source; running sources are left untouched
+            print(f"\n{_INFO}Starting newly added source...{_RST}")
             
             try:
-                # Stop all services
-                print(f"- Stopping all services...")
-                self.processor_manager.stop()
-                self.listener_manager.stop()
-                
-                # Start all services with new configuration
-                print(f"- Starting all services with new configuration...")
-                self.processor_manager.start()
-                self.listener_manager.start()
+                try:
+                    self.processor_manager.add_source(result['source_id'])
+                    self.listener_manager.add_source(result['source_id'])
+                except Exception as e:
+                    print(f"{_WARN}Could not start source directly ({e}), restarting all services...{_RST}")
+                    self._restart_services()
                 
-                print(f"{Fore.GREEN}Source started successfully.{ColorStyle.RESET_ALL}")
+                print(f"{_OK}Source started successfully.{_RST}")
             except Exception as e:
-                print(f"{Fore.RED}Error starting services: {e}{ColorStyle.RESET_ALL}")
-                print(f"{Fore.YELLOW}Source configuration saved, but service could not be started.{ColorStyle.RESET_ALL}")
-                print(f"{Fore.YELLOW}You may need to restart the application to fully apply changes.{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}Error starting services: {e}{_RST}")
+                print(f"{_WARN}Source configuration saved, but service could not be started.{_RST}")
+                print(_MSG_RESTART_HINT)
         else:
-            print(f"{Fore.RED}Failed to add source: {result['error']}{ColorStyle.RESET_ALL}")
+            print(f"{_ERR}Failed to add source: {result['error']}{_RST}")
         
         print("\nReturning to main menu...")
-        input("Press Enter to continue...")
+        self._pause()
         clear()  # Ensure screen is cleared before returning
         return  # Return to previous menu
     
     def _manage_sources(self):
         """Manage existing sources."""
         while True:
-            clear()
-            self._print_header()
-            print(f"{Fore.CYAN}=== Manage Sources ==={ColorStyle.RESET_ALL}")
+            header = self._begin_render()
+            lines = [f"{_INFO}=== Manage Sources ==={_RST}"]
+            if self.source_manager.save_error:
+                lines.append(f"{_ERR}{self.source_manager.save_error}{_RST}")
             
             sources = self.source_manager.get_sources()
             if not sources:
-                print("No sources configured.")
-                input("Press Enter to return to main menu...")
+                lines.append("No sources configured.")
+                self._write(header + "\n".join(lines) + "\n")
+                self._pause("Press Enter to return to main menu...")
                 return
             
-            print("\nConfigured Sources:")
-            for i, (source_id, source) in enumerate(sources.items(), 1):
-                print(f"{i}. {source['source_name']} ({source['source_ip']}:{source['listener_port']} {source['protocol']})")
+            if self._sources_listing_version != self.source_manager.version:
+                self._sources_listing = "\n".join(["\nConfigured Sources:"] + [
+                    f"{i}. {source['source_name']} ({source['source_ip']}:{source['listener_port']} {source['protocol']})"
+                    for i, source in enumerate(sources.values(), 1)
+                ])
+                self._sources_listing_version = self.source_manager.version
+            lines.append(self._sources_listing)
             
-            print("\nOptions:")
-            print("0. Return to Main Menu")
-            print("1-N. Select Source to Manage")
+            lines.append("\nOptions:")
+            lines.append("0. Return to Main Menu")
+            lines.append("1-N. Select Source to Manage")
+            self._write(header + "\n".join(lines) + "\n")
             
             choice = prompt(
-                HTML("<ansicyan>Choose an option: </ansicyan>"),
+                _PROMPTS["manage_sources"],
                 style=self.prompt_style
             )
             
@@ -355,62 +609,65 @@ class CLI:
             try:
                 index = int(choice) - 1
                 if 0 <= index < len(sources):
-                    source_id = list(sources.keys())[index]
-                    self._manage_source(source_id)
+                    source_id = next(itertools.islice(sources, index, index + 1))
+                    self._open_screen(self._manage_source, source_id)
                 else:
-                    print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
-                    input("Press Enter to continue...")
+                    print(_MSG_INVALID_CHOICE)
+                    self._pause()
             except ValueError:
-                print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
+                print(_MSG_INVALID_CHOICE)
+                self._pause()
     
     def _manage_source(self, source_id):
         """Manage a specific source."""
         while True:
-            clear()
-            self._print_header()
+            header = self._begin_render()
             source = self.source_manager.get_source(source_id)
             if not source:
-                print(f"{Fore.RED}Source not found.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
+                self._write(header)
+                print(_MSG_SOURCE_NOT_FOUND)
+                self._pause()
                 return
             
-            print(f"{Fore.CYAN}=== Manage Source: {source['source_name']} ==={ColorStyle.RESET_ALL}")
-            print(f"\nSource ID: {source_id}")
-            print(f"Source Name: {source['source_name']}")
-            print(f"Source IP: {source['source_ip']}")
-            print(f"Listener Port: {source['listener_port']}")
-            print(f"Protocol: {source['protocol']}")
-            print(f"Target Type: {source['target_type']}")
+            lines = [
+                f"{_INFO}=== Manage Source: {source['source_name']} ==={_RST}",
+                f"\nSource ID: {source_id}",
+                f"Source Name: {source['source_name']}",
+                f"Source IP: {source['source_ip']}",
+                f"Listener Port: {source['listener_port']}",
+                f"Protocol: {source['protocol']}",
+                f"Target Type: {source['target_type']}",
+            ]
             
             if source['target_type'] == "FOLDER":
-                print(f"Folder Path: {source['folder_path']}")
+                lines.append(f"Folder Path: {source['folder_path']}")
             elif source['target_type'] == "HEC":
-                print(f"HEC URL: {source['hec_url']}")
-                print(f"HEC Token: {'*' * 10}")
+                lines.append(f"HEC URL: {source['hec_url']}")
+                lines.append(f"HEC Token: {'*' * 10}")
             
-            print(f"Batch Size: {source.get('batch_size', 'Default')}")
+            lines.append(f"Batch Size: {source.get('batch_size', 'Default')}")
             
-            print("\nOptions:")
-            print("1. Edit Source")
-            print("2. Delete Source")
-            print("3. Return to Sources List")
+            lines.append("\nOptions:")
+            lines.append("1. Edit Source")
+            lines.append("2. Delete Source")
+            lines.append("3. Return to Sources List")
+            self._write(header + "\n".join(lines) + "\n")
             
             choice = prompt(
-                HTML("<ansicyan>Choose an option (1-3): </ansicyan>"),
+                _PROMPTS["manage_source"],
                 style=self.prompt_style
             )
             
             if choice == "1":
-                self._edit_source(source_id)
+                self._open_screen(self._edit_source, source_id)
             elif choice == "2":
-                self._delete_source(source_id)
+                self._open_screen(self._delete_source, source_id)
                 return
             elif choice == "3":
                 return
             else:
-                print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
+                print(_MSG_INVALID_CHOICE)
+                self._pause()
     
     def _edit_source(self, source_id):
         """Edit a source configuration."""
@@ -418,11 +675,11 @@ class CLI:
         self._print_header()
         source = self.source_manager.get_source(source_id)
         if not source:
-            print(f"{Fore.RED}Source not found.{ColorStyle.RESET_ALL}")
-            input("Press Enter to continue...")
+            print(_MSG_SOURCE_NOT_FOUND)
+            self._pause()
             return
         
-        print(f"{Fore.CYAN}=== Edit Source: {source['source_name']} ==={ColorStyle.RESET_ALL}")
+        print(f"{_INFO}=== Edit Source: {source['source_name']} ==={_RST}")
         print("Leave fields blank to keep current values.")
         
         # Create a copy for updates
@@ -436,11 +693,6 @@ class CLI:
         
         # Get source IP
         current_ip = source['source_ip']
-        ip_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-        
-        # Check if IP already exists in any OTHER source
-        existing_ips = [src["source_ip"] for src_id, src in self.source_manager.get_sources().items() 
-                       if src_id != source_id]
         
         while True:
             new_ip = prompt(f"Source IP [{current_ip}]: ")
@@ -448,35 +700,30 @@ class CLI:
                 break
             
             # Check if the IP is already in use by another source
-            if new_ip in existing_ips:
-                print(f"{Fore.RED}This IP is already used by another source. Please enter a different IP.{ColorStyle.RESET_ALL}")
+            if self.source_manager.has_ip(new_ip, exclude_id=source_id):
+                print(_MSG_IP_IN_USE)
                 continue
                 
-            if re.match(ip_pattern, new_ip):
-                # Validate each octet
-                octets = [int(octet) for octet in new_ip.split(".")]
-                if all(0 <= octet <= 255 for octet in octets):
-                    updated_data["source_ip"] = new_ip
-                    break
+            if _valid_ipv4(new_ip):
+                updated_data["source_ip"] = new_ip
+                break
             
-            print(f"{Fore.RED}Invalid IP address. Please enter a valid IPv4 address.{ColorStyle.RESET_ALL}")
+            print(_MSG_INVALID_IP)
         
         # Get listener port
         current_port = source['listener_port']
         while True:
-            new_port = prompt(f"Listener Port [{current_port}]: ")
+            new_port = prompt(f"Listener Port [{current_port}]: ").strip()
             if not new_port:
                 break
             
-            try:
-                port = int(new_port)
-                if 1 <= port <= 65535:
-                    updated_data["listener_port"] = port
-                    break
-                else:
-                    print(f"{Fore.RED}Port must be between 1 and 65535.{ColorStyle.RESET_ALL}")
-            except ValueError:
-                print(f"{Fore.RED}Invalid port. Please enter a valid number.{ColorStyle.RESET_ALL}")
+            if not new_port.isdecimal():
+                print(_MSG_INVALID_PORT)
+            elif 1 <= int(new_port) <= 65535:
+                updated_data["listener_port"] = int(new_port)
+                break
+            else:
+                print(_MSG_PORT_RANGE)
         
         # Get protocol - simplified to accept single letter
         current_protocol = source['protocol']
@@ -491,38 +738,33 @@ class CLI:
         if source['target_type'] == "FOLDER":
             # Get folder path with improved guidance
             current_path = source['folder_path']
-            print(f"\n{Fore.CYAN}Current folder path: {current_path}{ColorStyle.RESET_ALL}")
-            print(f"\n{Fore.CYAN}Folder Path Examples:{ColorStyle.RESET_ALL}")
+            print(f"\n{_INFO}Current folder path: {current_path}{_RST}")
+            print(f"\n{_INFO}Folder Path Examples:{_RST}")
             print("  - Local folder: C:\\logs\\collector")
             print("  - Network share: \\\\server\\share\\logs")
             print("  - Linux path: /var/log/collector")
             
             new_path = prompt(f"\nNew Folder Path (or leave blank to keep current): ")
             if new_path:
-                path = Path(new_path)
-                if not path.exists():
+                if not os.path.isdir(new_path):
                     try:
-                        os.makedirs(path, exist_ok=True)
-                        print(f"{Fore.GREEN}Created folder: {path}{ColorStyle.RESET_ALL}")
+                        os.makedirs(new_path, exist_ok=True)
+                        print(f"{_OK}Created folder: {new_path}{_RST}")
                     except Exception as e:
-                        print(f"{Fore.RED}Error creating folder: {e}{ColorStyle.RESET_ALL}")
-                        print(f"{Fore.YELLOW}Please ensure the path is valid and you have permission to create it.{ColorStyle.RESET_ALL}")
-                        input("Press Enter to continue...")
+                        print(f"{_ERR}Error creating folder: {e}{_RST}")
+                        print(_MSG_CHECK_PATH)
+                        self._pause()
                         return
                 
                 # Check if folder is writable
-                try:
-                    test_file = path / ".test_write_access"
-                    with open(test_file, "w") as f:
-                        f.write("test")
-                    os.remove(test_file)
-                    updated_data["folder_path"] = str(path)
-                    print(f"{Fore.GREEN}Folder is accessible and writable.{ColorStyle.RESET_ALL}")
-                except Exception as e:
-                    print(f"{Fore.RED}Folder is not writable: {e}{ColorStyle.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Please ensure you have write permissions to this folder.{ColorStyle.RESET_ALL}")
-                    input("Press Enter to continue...")
+                write_check = self.source_manager.check_folder_writable(new_path)
+                if not write_check["valid"]:
+                    print(f"{_ERR}{write_check['error']}{_RST}")
+                    print(_MSG_CHECK_WRITE_PERMS)
+                    self._pause()
                     return
+                updated_data["folder_path"] = os.path.abspath(new_path)
+                print(_MSG_FOLDER_WRITABLE)
             
             # Get batch size
             current_batch = source.get('batch_size', DEFAULT_FOLDER_BATCH_SIZE)
@@ -542,7 +784,7 @@ class CLI:
                     updated_data["hec_url"] = new_url
                     break
                 
-                print(f"{Fore.RED}Invalid URL. Please enter a valid URL starting with http:// or https://.{ColorStyle.RESET_ALL}")
+                print(_MSG_INVALID_URL)
             
             # Get HEC token
             new_token = prompt("HEC Token (leave blank to keep current): ")
@@ -557,162 +799,171 @@ class CLI:
         
         # Update the source if changes were made
         if updated_data:
-            print(f"\n{Fore.CYAN}Updating source configuration...{ColorStyle.RESET_ALL}")
+            print(f"\n{_INFO}Updating source configuration...{_RST}")
             result = self.source_manager.update_source(source_id, updated_data)
             
             if result["success"]:
-                print(f"{Fore.GREEN}Source updated successfully.{ColorStyle.RESET_ALL}")
+                print(f"{_OK}Source updated successfully.{_RST}")
                 
-                # Restart services using the same approach as in _add_source
-                print(f"\n{Fore.CYAN}Applying changes...{ColorStyle.RESET_ALL}")
+                # Restart only this source's listener and processors
+                print(f"\n{_INFO}Applying changes...{_RST}")
                 
                 try:
-                    # Stop all services
-                    print(f"- Stopping all services...")
-                    self.processor_manager.stop()
-                    self.listener_manager.stop()
-                    
-                    # Start all services with new configuration
-                    print(f"- Starting all services with new configuration...")
-                    self.processor_manager.start()
-                    self.listener_manager.start()
+                    try:
+                        self.listener_manager.update_source(source_id)
+                        self.processor_manager.update_source(source_id)
+                    except Exception as e:
+                        print(f"{_WARN}Could not update source directly ({e}), restarting all services...{_RST}")
+                        self._restart_services()
                     
-                    print(f"{Fore.GREEN}Changes applied successfully.{ColorStyle.RESET_ALL}")
+                    print(f"{_OK}Changes applied successfully.{_RST}")
                 except Exception as e:
-                    print(f"{Fore.RED}Error applying changes: {e}{ColorStyle.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Source configuration saved, but service update may be incomplete.{ColorStyle.RESET_ALL}")
-                    print(f"{Fore.YELLOW}You may need to restart the application to fully apply changes.{ColorStyle.RESET_ALL}")
+                    print(f"{_ERR}Error applying changes: {e}{_RST}")
+                    print(f"{_WARN}Source configuration saved, but service update may be incomplete.{_RST}")
+                    print(_MSG_RESTART_HINT)
             else:
-                print(f"{Fore.RED}Failed to update source: {result['error']}{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}Failed to update source: {result['error']}{_RST}")
         else:
-            print(f"{Fore.YELLOW}No changes were made.{ColorStyle.RESET_ALL}")
+            print(f"{_WARN}No changes were made.{_RST}")
         
-        input("Press Enter to continue...")
+        self._pause()
     
     def _delete_source(self, source_id):
         """Delete a source."""
         source = self.source_manager.get_source(source_id)
         if not source:
-            print(f"{Fore.RED}Source not found.{ColorStyle.RESET_ALL}")
-            input("Press Enter to continue...")
+            print(_MSG_SOURCE_NOT_FOUND)
+            self._pause()
             return
         
-        confirm = prompt(f"Are you sure you want to delete source '{source['source_name']}'? (y/n): ")
-        if confirm.lower() != 'y':
+        confirm = self._confirm(f"Are you sure you want to delete source '{source['source_name']}'? (y/n): ")
+        if confirm != 'y':
             print("Deletion cancelled.")
-            input("Press Enter to continue...")
+            self._pause()
             return
         
         result = self.source_manager.delete_source(source_id)
         if result["success"]:
-            print(f"{Fore.GREEN}Source deleted successfully.{ColorStyle.RESET_ALL}")
+            print(f"{_OK}Source deleted successfully.{_RST}")
             
-            # Restart services using the same approach as in _add_source
-            print(f"\n{Fore.CYAN}Applying changes...{ColorStyle.RESET_ALL}")
+            # Stop only the deleted source, listener first so no new logs are queued
+            print(f"\n{_INFO}Applying changes...{_RST}")
             
             try:
-                # Stop all services
-                print(f"- Stopping all services...")
-                self.processor_manager.stop()
-                self.listener_manager.stop()
-                
-                # Start all services with new configuration
-                print(f"- Starting all services with new configuration...")
-                self.processor_manager.start()
-                self.listener_manager.start()
+                try:
+                    self.listener_manager.remove_source(source_id)
+                    self.processor_manager.remove_source(source_id)
+                except Exception as e:
+                    print(f"{_WARN}Could not stop source directly ({e}), restarting all services...{_RST}")
+                    self._restart_services()
                 
-                print(f"{Fore.GREEN}Changes applied successfully.{ColorStyle.RESET_ALL}")
+                print(f"{_OK}Changes applied successfully.{_RST}")
             except Exception as e:
-                print(f"{Fore.RED}Error applying changes: {e}{ColorStyle.RESET_ALL}")
-                print(f"{Fore.YELLOW}Source deleted, but service update may be incomplete.{ColorStyle.RESET_ALL}")
-                print(f"{Fore.YELLOW}You may need to restart the application to fully apply changes.{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}Error applying changes: {e}{_RST}")
+                print(f"{_WARN}Source deleted, but service update may be incomplete.{_RST}")
+                print(_MSG_RESTART_HINT)
         else:
-            print(f"{Fore.RED}Failed to delete source: {result['error']}{ColorStyle.RESET_ALL}")
+            print(f"{_ERR}Failed to delete source: {result['error']}{_RST}")
         
-        input("Press Enter to continue...")
+        self._pause()
+    
+    def _restart_services(self):
+        """Fully restart processors and listeners.
+        
+        Fallback for when an incremental source change fails.
+        """
+        # Stop all services
+        print(f"- Stopping all services...")
+        self.processor_manager.stop()
+        self.listener_manager.stop()
+        
+        # Start all services with new configuration
+        print(f"- Starting all services with new configuration...")
+        self.processor_manager.start()
+        self.listener_manager.start()
     
     def _configure_health_check(self):
         """Configure health check monitoring."""
-        clear()
-        self._print_header()
-        print(f"{Fore.CYAN}=== Health Check Configuration ==={ColorStyle.RESET_ALL}")
-        
-        # Check if health check is already configured
-        is_configured = hasattr(self.health_check, 'config') and self.health_check.config is not None
-        is_running = is_configured and self.health_check.running
-        
-        if is_configured:
-            config = self.health_check.config
-            print(f"\nCurrent Configuration:")
-            print(f"HEC URL: {config['hec_url']}")
-            print(f"HEC Token: {'*' * 10}")
-            print(f"Interval: {config['interval']} seconds")
-            print(f"Status: {'Running' if is_running else 'Stopped'}")
-            
-            print("\nOptions:")
-            print("1. Update Configuration")
-            print("2. Start/Stop Health Check")
-            print("3. Return to Main Menu")
+        while True:
+            header = self._begin_render()
+            lines = [f"{_INFO}=== Health Check Configuration ==={_RST}"]
             
-            choice = prompt(
-                HTML("<ansicyan>Choose an option (1-3): </ansicyan>"),
-                style=self.prompt_style
-            )
+            # Check if health check is already configured
+            is_configured = self.health_check.config is not None
+            is_running = is_configured and self.health_check.running
             
-            if choice == "1":
-                self._update_health_check()
-                return  # Return after update to prevent menu stacking
-            elif choice == "2":
-                if is_running:
-                    self.health_check.stop()
-                    print(f"{Fore.YELLOW}Health check monitoring stopped.{ColorStyle.RESET_ALL}")
-                else:
-                    if self.health_check.start():
-                        print(f"{Fore.GREEN}Health check monitoring started.{ColorStyle.RESET_ALL}")
+            if is_configured:
+                config = self.health_check.config
+                lines.append(f"\nCurrent Configuration:")
+                lines.append(f"HEC URL: {config['hec_url']}")
+                lines.append(f"HEC Token: {'*' * 10}")
+                lines.append(f"Interval: {config['interval']} seconds")
+                lines.append(f"Status: {'Running' if is_running else 'Stopped'}")
+                
+                lines.append("\nOptions:")
+                lines.append("1. Update Configuration")
+                lines.append("2. Start/Stop Health Check")
+                lines.append("3. Return to Main Menu")
+                self._write(header + "\n".join(lines) + "\n")
+                
+                choice = prompt(
+                    _PROMPTS["health_check_configured"],
+                    style=self.prompt_style
+                )
+                
+                if choice == "1":
+                    self._open_screen(self._update_health_check)
+                    return  # Return after update to prevent menu stacking
+                elif choice == "2":
+                    if is_running:
+                        self.health_check.stop()
+                        print(f"{_WARN}Health check monitoring stopped.{_RST}")
                     else:
-                        print(f"{Fore.RED}Failed to start health check monitoring.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
-                clear()  # Clear screen when returning
-                return
-            elif choice == "3":
-                clear()  # Clear screen when returning
-                return
-            else:
-                print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
-                self._configure_health_check()  # Recursive call to show the menu again
-                return
-        else:
-            print("Health check is not configured.")
-            print("\nOptions:")
-            print("1. Configure Health Check")
-            print("2. Return to Main Menu")
-            
-            choice = prompt(
-                HTML("<ansicyan>Choose an option (1-2): </ansicyan>"),
-                style=self.prompt_style
-            )
-            
-            if choice == "1":
-                self._update_health_check()
-                return  # Return after update to prevent menu stacking
-            elif choice == "2":
-                clear()  # Clear screen when returning
-                return
+                        if self.health_check.start():
+                            print(f"{_OK}Health check monitoring started.{_RST}")
+                        else:
+                            print(f"{_ERR}Failed to start health check monitoring.{_RST}")
+                    self._pause()
+                    clear()  # Clear screen when returning
+                    return
+                elif choice == "3":
+                    clear()  # Clear screen when returning
+                    return
+                else:
+                    print(_MSG_INVALID_CHOICE)
+                    self._pause()
+                    continue  # Show the menu again
             else:
-                print(f"{Fore.RED}Invalid choice. Please try again.{ColorStyle.RESET_ALL}")
-                input("Press Enter to continue...")
-                self._configure_health_check()  # Recursive call to show the menu again
-                return
+                lines.append("Health check is not configured.")
+                lines.append("\nOptions:")
+                lines.append("1. Configure Health Check")
+                lines.append("2. Return to Main Menu")
+                self._write(header + "\n".join(lines) + "\n")
+                
+                choice = prompt(
+                    _PROMPTS["health_check_unconfigured"],
+                    style=self.prompt_style
+                )
+                
+                if choice == "1":
+                    self._open_screen(self._update_health_check)
+                    return  # Return after update to prevent menu stacking
+                elif choice == "2":
+                    clear()  # Clear screen when returning
+                    return
+                else:
+                    print(_MSG_INVALID_CHOICE)
+                    self._pause()
+                    continue  # Show the menu again
     
     def _update_health_check(self):
         """Update health check configuration."""
         clear()
         self._print_header()
-        print(f"{Fore.CYAN}=== Configure Health Check ==={ColorStyle.RESET_ALL}")
+        print(f"{_INFO}=== Configure Health Check ==={_RST}")
         
         # Check if health check is already configured
-        is_configured = hasattr(self.health_check, 'config') and self.health_check.config is not None
+        is_configured = self.health_check.config is not None
         current_url = self.health_check.config['hec_url'] if is_configured else ""
         current_token = self.health_check.config['hec_token'] if is_configured else ""
         current_interval = self.health_check.config['interval'] if is_configured else DEFAULT_HEALTH_CHECK_INTERVAL
@@ -726,7 +977,7 @@ class CLI:
             if hec_url and hec_url.startswith(("http://", "https://")):
                 break
             
-            print(f"{Fore.RED}Invalid URL. Please enter a valid URL starting with http:// or https://.{ColorStyle.RESET_ALL}")
+            print(_MSG_INVALID_URL)
         
         # Get HEC token
         while True:
@@ -737,7 +988,7 @@ class CLI:
             if hec_token:
                 break
             
-            print(f"{Fore.RED}HEC token cannot be empty.{ColorStyle.RESET_ALL}")
+            print(_MSG_HEC_TOKEN_EMPTY)
         
         # Get interval
         while True:
@@ -751,37 +1002,37 @@ class CLI:
                 if interval > 0:
                     break
                 else:
-                    print(f"{Fore.RED}Interval must be greater than 0.{ColorStyle.RESET_ALL}")
+                    print(f"{_ERR}Interval must be greater than 0.{_RST}")
             except ValueError:
-                print(f"{Fore.RED}Invalid interval. Please enter a valid number.{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}Invalid interval. Please enter a valid number.{_RST}")
         
         # Configure health check
-        print(f"\n{Fore.CYAN}Testing health check connection...{ColorStyle.RESET_ALL}")
+        print(f"\n{_INFO}Testing health check connection...{_RST}")
         
         # Store current running state to restore it if needed
-        was_running = hasattr(self.health_check, 'running') and self.health_check.running
+        was_running = self.health_check.running
         
         # Stop health check if it's running
         if was_running:
             self.health_check.stop()
         
         if self.health_check.configure(hec_url, hec_token, interval):
-            print(f"{Fore.GREEN}Health check configured successfully.{ColorStyle.RESET_ALL}")
+            print(f"{_OK}Health check configured successfully.{_RST}")
             
             # Auto-start health check
             if self.health_check.start():
-                print(f"{Fore.GREEN}Health check monitoring started.{ColorStyle.RESET_ALL}")
+                print(f"{_OK}Health check monitoring started.{_RST}")
             else:
-                print(f"{Fore.RED}Failed to start health check monitoring.{ColorStyle.RESET_ALL}")
+                print(f"{_ERR}Failed to start health check monitoring.{_RST}")
         else:
-            print(f"{Fore.RED}Failed to configure health check.{ColorStyle.RESET_ALL}")
+            print(f"{_ERR}Failed to configure health check.{_RST}")
             
             # Restore previous health check state if possible
-            if was_running and hasattr(self.health_check, 'config') and self.health_check.config is not None:
+            if was_running and self.health_check.config is not None:
                 if self.health_check.start():
-                    print(f"{Fore.YELLOW}Restored previous health check configuration.{ColorStyle.RESET_ALL}")
+                    print(f"{_WARN}Restored previous health check configuration.{_RST}")
         
-        input("Press Enter to continue...")
+        self._pause()
         clear()  # Clear screen when returning
         return
     
@@ -789,50 +1040,144 @@ class CLI:
         """View system and sources status in real-time until key press."""
         clear()
         self._print_header()
-        print(f"{Fore.CYAN}=== Live System Status ==={ColorStyle.RESET_ALL}")
-        print(f"{Fore.YELLOW}Press any key to return to main menu...{ColorStyle.RESET_ALL}")
+        print(f"{_INFO}=== Live System Status ==={_RST}")
+        print(f"{_WARN}Press any key to return to main menu...{_RST}")
         
         # Function to format timestamp
         def format_timestamp(timestamp):
             if timestamp is None:
                 return "Never"
+            if isinstance(timestamp, (int, float)):
+                return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
             return timestamp.strftime("%Y-%m-%d %H:%M:%S")
         
-        # Function to generate bar graph
-        def get_bar(percentage, width=20):
-            filled_width = int(width * percentage / 100)
-            bar = '█' * filled_width + '░' * (width - filled_width)
-            return bar
+        # Frame sections, each returning a list of lines
+        def system_lines(snapshot, thread_count):
+            if snapshot is None:
+                return ["", f"{_INFO}System Resources:{_RST}", "Sampling...", f"Active Threads: {thread_count}"]
+            
+            cpu_percent, memory, disk, net_io = snapshot
+            return [
+                "",
+                f"{_INFO}System Resources:{_RST}",
+                f"CPU Usage:    {_get_bar(cpu_percent)} {cpu_percent}%",
+                f"Memory Usage: {_get_bar(memory.percent)} {memory.percent}% ({_format_bytes(memory.used)} / {_format_bytes(memory.total)})",
+                f"Disk Usage:   {_get_bar(disk.percent)} {disk.percent}% ({_format_bytes(disk.used)} / {_format_bytes(disk.total)})",
+                f"Network:      ↑ {_format_bytes(net_io.bytes_sent)} sent | ↓ {_format_bytes(net_io.bytes_recv)} received",
+                f"Active Threads: {thread_count}",
+            ]
         
-        # Function to format bytes to human-readable format
-        def format_bytes(bytes_value):
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_value < 1024.0:
-                    return f"{bytes_value:.2f} {unit}"
-                bytes_value /= 1024.0
-            return f"{bytes_value:.2f} PB"
+        def health_check_lines():
+            lines = ["", f"{_INFO}Health Check Status:{_RST}"]
+            hc = self.health_check
+            is_configured = hc.config is not None
+            is_running = is_configured and hc.running
+            
+            if is_configured:
+                lines.append(f"  Status: {'Running' if is_running else 'Stopped'}")
+                if is_running:
+                    lines.append(f"  Interval: {hc.config['interval']} seconds")
+            else:
+                lines.append(f"  Not Configured")
+            return lines
+        
+        def source_lines(sources, processed_logs_count, last_processed_timestamp):
+            if not sources:
+                return ["", f"{_WARN}No sources configured.{_RST}"]
+            
+            lines = ["", f"{_INFO}Active Sources:{_RST}"]
+            
+            # Create a table header
+            header = f"{'Source Name':<25} {'Status':<10} {'Queue':<10} {'Threads':<10} {'Processed Logs':<15} {'Last Activity':<20}"
+            lines += ["", f"{_OK}{header}{_RST}", "-" * len(header)]
+            
+            # Scan listeners and processors once per frame instead of per source
+            active_source_ids = set()
+            for key, thread in list(self.listener_manager.listeners.items()):
+                if thread.is_alive():
+                    protocol, port = key.split(":", 1)
+                    active_source_ids.update(self.source_manager.get_sources_by_listener(protocol, port))
+            alive_by_source = Counter(p_id.split(":", 1)[0]
+                                      for p_id, p_thread in list(self.processor_manager.processors.items())
+                                      if p_thread.is_alive())
+            
+            for source_id, source in sources.items():
+                # Get queue size if available
+                queue_size = 0
+                if source_id in self.processor_manager.queues:
+                    queue_size = self.processor_manager.queues[source_id].qsize()
+                
+                # Count active processors
+                active_processors = alive_by_source[source_id]
+                
+                # Check if listener is active
+                listener_active = source_id in active_source_ids
+                
+                # Get processed logs count
+                processed_count = processed_logs_count.get(source_id, 0)
+                
+                # Get last processed timestamp
+                last_timestamp = last_processed_timestamp.get(source_id)
+                last_activity = format_timestamp(last_timestamp)
+                
+                # Determine status color
+                status_color = _OK if listener_active else _ERR
+                status_text = "Active" if listener_active else "Inactive"
+                
+                # Source info as a table row, name cut to the column width
+                lines.append(f"{source['source_name']:<25.25} {status_color}{status_text:<10}{_RST} {queue_size:<10} {active_processors:<10} {processed_count:<15} {last_activity:<20}")
+            
+            # More detailed source information
+            lines += ["", f"{_INFO}Source Details:{_RST}"]
+            for source_id, source in sources.items():
+                lines += ["", f"{_WARN}{source['source_name']}{_RST}"]
+                lines.append(f"  IP: {source['source_ip']}")
+                lines.append(f"  Port: {source['listener_port']} ({source['protocol']})")
+                lines.append(f"  Target: {source['target_type']}")
+                if source['target_type'] == 'FOLDER':
+                    lines.append(f"  Folder Path: {source.get('folder_path', 'Not specified')}")
+                elif source['target_type'] == 'HEC':
+                    lines.append(f"  HEC URL: {source.get('hec_url', 'Not specified')}")
+                lines.append(f"  Batch Size: {source.get('batch_size', 'Default')}")
+            return lines
         
         # Main status display loop
         running = True
+        last_structure = None
+        self._prev_lines = None
         refresh_interval = 1.0  # Refresh every second
         update_count = 0
         
+        # psutil can stall under load, so sample on a separate thread and
+        # render whatever snapshot is newest; the queue holds only the latest
+        snapshots = queue.Queue(maxsize=1)
+        stop_sampler = threading.Event()
+        snapshot = None
+        
         try:
             # Setup terminal for non-blocking input
             self._setup_terminal()
             
+            threading.Thread(
+                target=self._sample_loop,
+                args=(snapshots, stop_sampler, refresh_interval),
+                daemon=True
+            ).start()
+            
             while running:
                 # Get current timestamp
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                current_time = time.strftime("%Y-%m-%d %H:%M:%S")
                 
-                # Get system information
-                cpu_percent = psutil.cpu_percent(interval=0.5)
-                memory = psutil.virtual_memory()
-                disk = psutil.disk_usage('/')
-                net_io = psutil.net_io_counters()
+                # Get system information, keeping the last snapshot if no new one is
+                # ready; the first frame waits briefly so it rarely shows a placeholder
+                try:
+                    snapshot = snapshots.get(timeout=0.2) if snapshot is None else snapshots.get_nowait()
+                except queue.Empty:
+                    pass
                 
-                # Thread information
-                thread_count = threading.active_count()
+                # Thread information, re-counted when the sources change
+                structure = self.source_manager.version
+                thread_count = self._thread_count(refresh=structure != last_structure)
                 
                 # Get processor metrics
                 metrics = self.processor_manager.get_metrics()
@@ -842,128 +1187,138 @@ class CLI:
                 # Get sources information
                 sources = self.source_manager.get_sources()
                 
-                # Move cursor to beginning and clear screen
-                print("\033[H\033[J", end="")
+                # Build the frame section by section
+                lines = self._header_text.split("\n")[:-1]
+                lines += [
+                    f"{_INFO}=== Live System Status ==={_RST}",
+                    f"{_WARN}Press any key to return to main menu...{_RST}",
+                    "",
+                    f"Last updated: {current_time} (refresh #{update_count})",
+                ]
+                lines += system_lines(snapshot, thread_count)
+                lines += health_check_lines()
+                lines += source_lines(sources, processed_logs_count, last_processed_timestamp)
                 
-                # Print header
-                self._print_header()
-                print(f"{Fore.CYAN}=== Live System Status ==={ColorStyle.RESET_ALL}")
-                print(f"{Fore.YELLOW}Press any key to return to main menu...{ColorStyle.RESET_ALL}")
-                print(f"\nLast updated: {current_time} (refresh #{update_count})")
-                
-                # System Resources
-                print(f"\n{Fore.CYAN}System Resources:{ColorStyle.RESET_ALL}")
-                
-                # CPU
-                cpu_bar = get_bar(cpu_percent)
-                print(f"CPU Usage:    {cpu_bar} {cpu_percent}%")
-                
-                # Memory
-                mem_bar = get_bar(memory.percent)
-                print(f"Memory Usage: {mem_bar} {memory.percent}% ({format_bytes(memory.used)} / {format_bytes(memory.total)})")
-                
-                # Disk
-                disk_bar = get_bar(disk.percent)
-                print(f"Disk Usage:   {disk_bar} {disk.percent}% ({format_bytes(disk.used)} / {format_bytes(disk.total)})")
-                
-                # Network
-                print(f"Network:      ↑ {format_bytes(net_io.bytes_sent)} sent | ↓ {format_bytes(net_io.bytes_recv)} received")
-                
-                # Thread count
-                print(f"Active Threads: {thread_count}")
-                
-                # Health check status
-                print(f"\n{Fore.CYAN}Health Check Status:{ColorStyle.RESET_ALL}")
-                is_configured = hasattr(self.health_check, 'config') and self.health_check.config is not None
-                is_running = is_configured and self.health_check.running
-                
-                if is_configured:
-                    print(f"  Status: {'Running' if is_running else 'Stopped'}")
-                    if is_running:
-                        print(f"  Interval: {self.health_check.config['interval']} seconds")
-                else:
-                    print(f"  Not Configured")
-                
-                # Sources information
-                if sources:
-                    print(f"\n{Fore.CYAN}Active Sources:{ColorStyle.RESET_ALL}")
-                    
-                    # Create a table header
-                    header = f"{'Source Name':<25} {'Status':<10} {'Queue':<10} {'Threads':<10} {'Processed Logs':<15} {'Last Activity':<20}"
-                    print(f"\n{Fore.GREEN}{header}{ColorStyle.RESET_ALL}")
-                    print("-" * len(header))
-                    
-                    for source_id, source in sources.items():
-                        # Get queue size if available
-                        queue_size = 0
-                        if source_id in self.processor_manager.queues:
-                            queue_size = self.processor_manager.queues[source_id].qsize()
-                        
-                        # Count active processors
-                        active_processors = sum(1 for p_id, p_thread in self.processor_manager.processors.items()
-                                              if p_id.startswith(f"{source_id}:") and p_thread.is_alive())
-                        
-                        # Check if listener is active
-                        listener_port = source["listener_port"]
-                        listener_protocol = source["protocol"]
-                        listener_key = f"{listener_protocol}:{listener_port}"
-                        listener_active = listener_key in self.listener_manager.listeners and self.listener_manager.listeners[listener_key].is_alive()
-                        
-                        # Get processed logs count
-                        processed_count = processed_logs_count.get(source_id, 0)
-                        
-                        # Get last processed timestamp
-                        last_timestamp = last_processed_timestamp.get(source_id)
-                        last_activity = format_timestamp(last_timestamp)
-                        
-                        # Determine status color
-                        status_color = Fore.GREEN if listener_active else Fore.RED
-                        status_text = "Active" if listener_active else "Inactive"
-                        
-                        # Print source info as a table row
-                        source_name = source['source_name'][:23] + '..' if len(source['source_name']) > 25 else source['source_name']
-                        print(f"{source_name:<25} {status_color}{status_text:<10}{ColorStyle.RESET_ALL} {queue_size:<10} {active_processors:<10} {processed_count:<15} {last_activity:<20}")
-                    
-                    # More detailed source information
-                    print(f"\n{Fore.CYAN}Source Details:{ColorStyle.RESET_ALL}")
-                    for source_id, source in sources.items():
-                        print(f"\n{Fore.YELLOW}{source['source_name']}{ColorStyle.RESET_ALL}")
-                        print(f"  IP: {source['source_ip']}")
-                        print(f"  Port: {source['listener_port']} ({source['protocol']})")
-                        print(f"  Target: {source['target_type']}")
-                        if source['target_type'] == 'FOLDER':
-                            print(f"  Folder Path: {source.get('folder_path', 'Not specified')}")
-                        elif source['target_type'] == 'HEC':
-                            print(f"  HEC URL: {source.get('hec_url', 'Not specified')}")
-                        print(f"  Batch Size: {source.get('batch_size', 'Default')}")
-                else:
-                    print(f"\n{Fore.YELLOW}No sources configured.{ColorStyle.RESET_ALL}")
-                
-                # Check for keypress
-                if self._is_key_pressed():
-                    self._read_key()  # Consume the keypress
-                    running = False
-                    break
+                # Repaint everything when the set of sources changes,
+                # otherwise only the lines that differ from the last frame
+                self._render_frame(lines, full=structure != last_structure)
+                last_structure = structure
                 
                 # Increment update counter
                 update_count += 1
                 
-                # Sleep for refresh interval
-                time.sleep(refresh_interval)
+                # Wait for the next refresh, returning at once on a keypress
+                if self._wait_for_key(refresh_interval):
+                    running = False
+                    break
         
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
             pass
         except Exception as e:
-            print(f"{Fore.RED}Error in status view: {e}{ColorStyle.RESET_ALL}")
+            print(f"{_ERR}Error in status view: {e}{_RST}")
         finally:
-            # Always restore terminal settings
+            # Always stop the sampler and restore terminal settings
+            stop_sampler.set()
             self._restore_terminal()
+            self._prev_lines = None
         
         # Clear screen once more before returning to menu
         clear()
         time.sleep(0.5)  # Brief pause before returning to menu
 
+    def _render_frame(self, lines, full=False):
+        """Write a status frame, redrawing only lines that changed.
+        
+        Lines are addressed by absolute row, so the whole frame is repainted
+        when its length changes, when it does not fit on screen (including
+        lines that would wrap), or when full is set.
+        
+        Args:
+            lines: Frame content, one string per screen row
+            full: Force a full repaint
+        """
+        prev = self._prev_lines
+        columns, rows = shutil.get_terminal_size()
+        
+        if (full or prev is None or len(prev) != len(lines) or len(lines) >= rows
+                or any(_visible_width(line) > columns for line in lines)):
+            # "\r\n" since the terminal is in raw mode without output translation
+            out = "\033[H\033[J" + "\r\n".join(lines)
+        else:
+            out = "".join(
+                f"\033[{row};1H\033[K{line}"
+                for row, (line, old) in enumerate(zip(lines, prev), 1)
+                if line != old
+            )
+        
+        self._prev_lines = lines
+        if out:
+            self._write(out)
+    
+    def _sample_system(self):
+        """Sample system resources, reusing recent values.
+        
+        CPU, memory and network are refreshed at most once a second and disk
+        usage at most every 5 seconds. CPU usage is measured since the
+        previous call rather than by blocking.
+        
+        Returns:
+            tuple: (cpu_percent, virtual_memory, disk_usage, net_io_counters)
+        """
+        cache = self._sys_cache
+        now = time.monotonic()
+        
+        if now - cache["ts"] >= 1.0:
+            cache["cpu"] = psutil.cpu_percent(interval=None)
+            cache["mem"] = psutil.virtual_memory()
+            cache["net"] = psutil.net_io_counters()
+            cache["ts"] = now
+        
+        if cache["disk"] is None or now - cache["disk_ts"] >= 5.0:
+            cache["disk"] = psutil.disk_usage('/')
+            cache["disk_ts"] = now
+        
+        return cache["cpu"], cache["mem"], cache["disk"], cache["net"]
+    
+    def _thread_count(self, refresh=False):
+        """Get the number of live threads, re-counting at most every 5 seconds.
+        
+        Args:
+            refresh: Re-count now, e.g. after listeners or processors changed
+            
+        Returns:
+            int: Number of live threads
+        """
+        count, ts = self._thread_count_cache
+        now = time.monotonic()
+        if refresh or now - ts >= 5.0:
+            count = threading.active_count()
+            self._thread_count_cache = (count, now)
+        return count
+    
+    def _sample_loop(self, snapshots, stop_event, interval):
+        """Publish system samples for the status view until stopped.
+        
+        Args:
+            snapshots: Queue of size one; an unread sample is replaced
+            stop_event: Event that ends the loop
+            interval: Seconds between samples
+        """
+        while not stop_event.is_set():
+            try:
+                snapshot = self._sample_system()
+            except Exception as e:
+                logger.error(f"Error sampling system status: {e}")
+            else:
+                # Only this thread puts, so after draining the put cannot block
+                try:
+                    snapshots.get_nowait()
+                except queue.Empty:
+                    pass
+                snapshots.put_nowait(snapshot)
+            stop_event.wait(interval)
+    
     def _setup_terminal(self):
         """Setup terminal for non-blocking input."""
         try:
@@ -992,25 +1347,47 @@ class CLI:
         except Exception as e:
             logger.error(f"Error restoring terminal: {e}")
     
-    def _is_key_pressed(self):
-        """Check if a key is pressed without blocking."""
+    def _wait_for_key(self, timeout):
+        """Wait up to timeout seconds for a key press.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if a key was pressed (and consumed), False on timeout
+        """
         try:
             if os.name == 'posix':
                 import select
-                return select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], [])
+                readable, _, _ = select.select([sys.stdin], [], [], timeout)
+                if readable:
+                    self._read_key()
+                    return True
+                return False
             elif os.name == 'nt':
                 import msvcrt
-                return msvcrt.kbhit()
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    if msvcrt.kbhit():
+                        self._read_key()
+                        return True
+                    time.sleep(0.05)
+                return False
         except Exception:
             # Fallback
-            return False
+            pass
+        time.sleep(timeout)
         return False
     
     def _read_key(self):
         """Read a key press."""
         try:
             if os.name == 'posix':
-                return sys.stdin.read(1)
+                # Read the fd directly so no text-layer buffer can hold back
+                # bytes that select() has already reported as readable. Take
+                # everything pending so the rest of a multi-byte key (arrows,
+                # F-keys, non-ASCII) is not left to leak into the next prompt
+                return os.read(sys.stdin.fileno(), 1024).decode('utf-8', errors='ignore')
             elif os.name == 'nt':
                 import msvcrt
                 if msvcrt.kbhit():
@@ -1022,26 +1399,28 @@ class CLI:
     
     def _exit_application(self):
         """Exit the application cleanly."""
-        print(f"\n{Fore.YELLOW}Are you sure you want to exit?{ColorStyle.RESET_ALL}")
-        confirm = prompt("Exit the application? (y/n): ")
+        print(f"\n{_WARN}Are you sure you want to exit?{_RST}")
+        confirm = self._confirm("Exit the application? (y/n): ")
         
-        if confirm.lower() == 'y':
-            self._clean_exit()
-            print(f"{Fore.GREEN}Graceful shutdown completed. Goodbye!{ColorStyle.RESET_ALL}")
-            sys.exit(0)
+        if confirm == 'y':
+            self._shutdown()
         else:
-            print(f"{Fore.GREEN}Continuing...{ColorStyle.RESET_ALL}")
+            print(_MSG_CONTINUING)
             return
             
     def _clean_exit(self):
         """Clean up resources before exiting."""
-        print(f"{Fore.CYAN}Shutting down services...{ColorStyle.RESET_ALL}")
+        print(f"{_INFO}Shutting down services...{_RST}")
         
         # Restore terminal settings
         self._restore_terminal()
         
+        # Write out any source changes still waiting on the save timer
+        if not self.source_manager.flush():
+            print(f"{_ERR}{self.source_manager.save_error}{_RST}")
+        
         # Stop health check if running
-        if hasattr(self.health_check, 'running') and self.health_check.running:
+        if self.health_check.running:
             print("- Stopping health check...")
             self.health_check.stop()
         
@@ -1053,6 +1432,6 @@ class CLI:
         print("- Stopping listeners...")
         self.listener_manager.stop()
         
-        print(f"{Fore.CYAN}All services stopped.{ColorStyle.RESET_ALL}")
+        print(f"{_INFO}All services stopped.{_RST}")
     
 
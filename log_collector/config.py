@@ -55,10 +55,18 @@ def load_sources():
         return {}
 
 def save_sources(sources):
-    """Save source configurations to JSON file."""
+    """Save source configurations to JSON file.
+    
+    Writes to a temporary file first and renames it over the old one, so a
+    crash mid-write never leaves a truncated sources file behind.
+    """
+    tmp_file = SOURCES_FILE.with_name(SOURCES_FILE.name + ".tmp")
     try:
-        with open(SOURCES_FILE, "w") as f:
+        with open(tmp_file, "w") as f:
             json.dump(sources, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, SOURCES_FILE)
         return True
     except Exception as e:
         logger.error(f"Error saving sources file: {e}")
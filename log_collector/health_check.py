@@ -28,6 +28,7 @@ class HealthCheck:
         self.config = None
         self.thread = None
         self.running = False
+        self._process = None  # cached psutil.Process for this process
     
     def configure(self, hec_url, hec_token, interval=DEFAULT_HEALTH_CHECK_INTERVAL):
         """Configure health check settings.
@@ -212,13 +213,24 @@ class HealthCheck:
                 },
                 "sources": source_stats,
                 "pid": os.getpid(),
-                "process_memory": psutil.Process(os.getpid()).memory_info().rss
+                "process_memory": self._get_process().memory_info().rss
             },
             "source": "Heartbeat"
         }
         
         return health_data
     
+    def _get_process(self):
+        """Get a psutil handle for this process, reused across reports.
+        
+        Returns:
+            psutil.Process: Handle for the current PID
+        """
+        pid = os.getpid()
+        if self._process is None or self._process.pid != pid:
+            self._process = psutil.Process(pid)
+        return self._process
+    
     def _send_health_data(self, health_data):
         """Send health data to HEC.
         
@@ -24,6 +24,9 @@ class LogListener:
         self.source_manager = source_manager
         self.processor_manager = processor_manager
         self.listeners = {}  # port -> listener thread mapping
+        self.stop_events = {}  # listener key -> stop event for that listener
+        self.port_sources = {}  # port -> {source_id: (source_ip, protocol)}
+        self.ip_maps = {}  # port -> {source_ip: source_id}, shared with listener threads
         self.running = False
         self.lock = threading.Lock()
     
@@ -49,8 +52,112 @@ class LogListener:
         for listener_thread in self.listeners.values():
             listener_thread.join(timeout=5)
         self.listeners = {}
+        self.stop_events = {}
+        self.port_sources = {}
+        self.ip_maps = {}
         logger.info("All listeners stopped")
     
+    def add_source(self, source_id):
+        """Start accepting logs for a newly added source.
+        
+        Sources on a port that already has a listener are picked up by
+        updating its IP map in place; a new listener is only started when the
+        port/protocol pair is not yet served.
+        
+        Args:
+            source_id: Source ID to add
+        """
+        source = self.source_manager.get_source(source_id)
+        if not source:
+            logger.error(f"Cannot add listener for unknown source {source_id}")
+            return
+        
+        with self.lock:
+            self.running = True
+            port = int(source["listener_port"])
+            protocol = source["protocol"]
+            
+            self.port_sources.setdefault(port, {})[source_id] = (source["source_ip"], protocol)
+            ip_map = self.ip_maps.setdefault(port, {})
+            ip_map[source["source_ip"]] = source_id
+            
+            key = f"{protocol}:{port}"
+            if key not in self.listeners or not self.listeners[key].is_alive():
+                self._start_protocol_listener(protocol, port, ip_map)
+    
+    def remove_source(self, source_id):
+        """Stop accepting logs for a deleted source.
+        
+        Listeners left without any source for their protocol are stopped;
+        all others keep running.
+        
+        Args:
+            source_id: Source ID to remove
+        """
+        to_join = []
+        with self.lock:
+            for port, port_sources in list(self.port_sources.items()):
+                if source_id not in port_sources:
+                    continue
+                
+                source_ip, protocol = port_sources.pop(source_id)
+                ip_map = self.ip_maps.get(port, {})
+                if ip_map.get(source_ip) == source_id:
+                    del ip_map[source_ip]
+                
+                # Stop the listener if no remaining source needs this protocol
+                if not any(p == protocol for _, p in port_sources.values()):
+                    key = f"{protocol}:{port}"
+                    if key in self.listeners:
+                        self.stop_events.pop(key).set()
+                        to_join.append(self.listeners.pop(key))
+                
+                if not port_sources:
+                    del self.port_sources[port]
+                    self.ip_maps.pop(port, None)
+        
+        for listener_thread in to_join:
+            listener_thread.join(timeout=5)
+    
+    def update_source(self, source_id):
+        """Apply a configuration change to a source.
+        
+        Changes that do not touch the listener (name, target, batch size)
+        leave it alone, and an IP change is applied to the IP map in place.
+        Only a port or protocol change restarts listeners, so edits do not
+        drop packets or TCP connections of the source.
+        
+        Args:
+            source_id: Source ID that was updated
+        """
+        source = self.source_manager.get_source(source_id)
+        if not source:
+            self.remove_source(source_id)
+            return
+        
+        port = int(source["listener_port"])
+        protocol = source["protocol"]
+        source_ip = source["source_ip"]
+        
+        with self.lock:
+            current = self.port_sources.get(port, {}).get(source_id)
+            key = f"{protocol}:{port}"
+            listener_alive = key in self.listeners and self.listeners[key].is_alive()
+            
+            if current is not None and current[1] == protocol and listener_alive:
+                old_ip = current[0]
+                if old_ip != source_ip:
+                    ip_map = self.ip_maps[port]
+                    ip_map[source_ip] = source_id
+                    if ip_map.get(old_ip) == source_id:
+                        del ip_map[old_ip]
+                    self.port_sources[port][source_id] = (source_ip, protocol)
+                return
+        
+        # Port or protocol changed, or the listener is not running
+        self.remove_source(source_id)
+        self.add_source(source_id)
+    
     def update_listeners(self):
         """Update listeners based on current source configuration."""
         with self.lock:
@@ -67,39 +174,51 @@ class LogListener:
             port: Port number to listen on
             sources: List of (source_id, source_config) tuples sharing this port
         """
+        # Create source IP to source_id mapping for quick lookup
+        self.port_sources[port] = {
+            source_id: (source["source_ip"], source["protocol"]) for source_id, source in sources
+        }
+        ip_map = {source[1]["source_ip"]: source[0] for source in sources}
+        self.ip_maps[port] = ip_map
+        
         # Determine if we need TCP or UDP or both
         needs_tcp = any(source[1]["protocol"] == "TCP" for source in sources)
         needs_udp = any(source[1]["protocol"] == "UDP" for source in sources)
         
         # Start appropriate listener threads
         if needs_udp:
-            udp_thread = threading.Thread(
-                target=self._udp_listener,
-                args=(port, sources),
-                daemon=True
-            )
-            udp_thread.start()
-            self.listeners[f"UDP:{port}"] = udp_thread
+            self._start_protocol_listener("UDP", port, ip_map)
         
         if needs_tcp:
-            tcp_thread = threading.Thread(
-                target=self._tcp_listener,
-                args=(port, sources),
-                daemon=True
-            )
-            tcp_thread.start()
-            self.listeners[f"TCP:{port}"] = tcp_thread
+            self._start_protocol_listener("TCP", port, ip_map)
     
-    def _udp_listener(self, port, sources):
-        """UDP listener implementation.
+    def _start_protocol_listener(self, protocol, port, ip_map):
+        """Start a single UDP or TCP listener thread.
         
         Args:
+            protocol: "UDP" or "TCP"
             port: Port number to listen on
-            sources: List of (source_id, source_config) tuples for this port
+            ip_map: Mapping of source IPs to source IDs for this port
         """
-        # Create source IP to source_id mapping for quick lookup
-        ip_map = {source[1]["source_ip"]: source[0] for source in sources}
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=self._udp_listener if protocol == "UDP" else self._tcp_listener,
+            args=(port, ip_map, stop_event),
+            daemon=True
+        )
+        thread.start()
+        key = f"{protocol}:{port}"
+        self.listeners[key] = thread
+        self.stop_events[key] = stop_event
+    
+    def _udp_listener(self, port, ip_map, stop_event):
+        """UDP listener implementation.
         
+        Args:
+            port: Port number to listen on
+            ip_map: Mapping of source IPs to source IDs for this port
+            stop_event: Event set when this listener should stop
+        """
         # Set up UDP socket
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -111,14 +230,14 @@ class LogListener:
             # Set socket to non-blocking with timeout
             sock.settimeout(0.5)
             
-            while self.running:
+            while self.running and not stop_event.is_set():
                 try:
                     data, addr = sock.recvfrom(65535)  # Max UDP packet size
                     source_ip = addr[0]
                     
                     # Check if source IP is allowed
-                    if source_ip in ip_map:
-                        source_id = ip_map[source_ip]
+                    source_id = ip_map.get(source_ip)
+                    if source_id is not None:
                         self._process_log(data, source_id)
                     else:
                         logger.warning(f"Received UDP log from unauthorized IP: {source_ip}")
@@ -134,16 +253,14 @@ class LogListener:
         finally:
             sock.close()
     
-    def _tcp_listener(self, port, sources):
+    def _tcp_listener(self, port, ip_map, stop_event):
         """TCP listener implementation.
         
         Args:
             port: Port number to listen on
-            sources: List of (source_id, source_config) tuples for this port
+            ip_map: Mapping of source IPs to source IDs for this port
+            stop_event: Event set when this listener should stop
         """
-        # Create source IP to source_id mapping for quick lookup
-        ip_map = {source[1]["source_ip"]: source[0] for source in sources}
-        
         # Set up TCP socket
         server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -154,7 +271,7 @@ class LogListener:
             server_socket.settimeout(0.5)
             logger.info(f"TCP listener started on port {port}")
             
-            while self.running:
+            while self.running and not stop_event.is_set():
                 try:
                     client_socket, addr = server_socket.accept()
                     client_handler = threading.Thread(
@@ -185,17 +302,18 @@ class LogListener:
         source_ip = addr[0]
         
         # Check if source IP is allowed
-        if source_ip not in ip_map:
+        source_id = ip_map.get(source_ip)
+        if source_id is None:
             logger.warning(f"TCP connection from unauthorized IP: {source_ip}")
             client_socket.close()
             return
-        
-        source_id = ip_map[source_ip]
+
         client_socket.settimeout(30)  # 30-second timeout for inactivity
         
         try:
             buffer = b""
-            while self.running:
+            # Drop the connection if the source is removed or reassigned
+            while self.running and ip_map.get(source_ip) == source_id:
                 try:
                     data = client_socket.recv(4096)
                     if not data:
@@ -216,8 +334,8 @@ class LogListener:
                     logger.error(f"Error receiving TCP data: {e}")
                     break
             
-            # Process any remaining data in buffer
-            if buffer:
+            # Process any remaining data in buffer, unless the source is gone
+            if buffer and ip_map.get(source_ip) == source_id:
                 self._process_log(buffer, source_id)
         
         finally:
@@ -12,7 +12,6 @@ from log_collector.source_manager import SourceManager
 from log_collector.processor import ProcessorManager
 from log_collector.listener import LogListener
 from log_collector.health_check import HealthCheck
-from log_collector.cli import CLI
 from log_collector.utils import get_version
 
 def signal_handler(signum, frame):
@@ -72,6 +71,8 @@ def main():
         
         # Start CLI in interactive mode
         if not args.no_interactive:
+            # Imported here so service mode never loads prompt_toolkit/colorama
+            from log_collector.cli import CLI
             cli = CLI(source_manager, processor_manager, listener_manager, health_check)
             cli.start()
         else:
@@ -31,6 +31,7 @@ class ProcessorManager:
         self.source_manager = source_manager
         self.queues = {}  # source_id -> queue mapping
         self.processors = {}  # source_id -> processor thread mapping
+        self.stop_events = {}  # source_id -> event telling that source's processors to exit
         self.running = False
         self.lock = threading.Lock()
         
@@ -66,6 +67,7 @@ class ProcessorManager:
         
         self.processors = {}
         self.queues = {}
+        self.stop_events = {}
         logger.info("All processor threads stopped")
     
     def get_metrics(self):
@@ -87,11 +89,15 @@ class ProcessorManager:
             log_str: Log string to process
             source_id: Source ID this log came from
         """
-        # Ensure we have a queue and processor for this source
-        self._ensure_processor(source_id)
+        # Only sources set up by start()/add_source() are processed; logs still
+        # in flight for a removed source are dropped instead of reviving it
+        if self.source_manager.get_source(source_id) is None:
+            return
+        q = self._ensure_processor(source_id, create=False)
+        if q is None:
+            return
         
         # Add log to queue
-        q = self.queues[source_id]
         q.put(log_str)
         
         # Check if we need to spawn additional processor
@@ -102,16 +108,67 @@ class ProcessorManager:
         # If queue size exceeds limit, spawn additional processor
         if qsize > DEFAULT_QUEUE_LIMIT * current_processors:
             new_id = f"{source_id}:{time.time()}"
-            new_thread = threading.Thread(
-                target=self._processor_worker,
-                args=(new_id, source_id),
-                daemon=True
-            )
             with self.lock:
+                stop_event = self.stop_events.get(source_id)
+                if stop_event is None:
+                    # Source was removed meanwhile
+                    return
+                new_thread = threading.Thread(
+                    target=self._processor_worker,
+                    args=(new_id, source_id, q, stop_event),
+                    daemon=True
+                )
                 self.processors[new_id] = new_thread
                 new_thread.start()
             logger.info(f"Spawned additional processor for source {source_id} (queue size: {qsize})")
     
+    def add_source(self, source_id):
+        """Start processing a newly added source without restarting others.
+        
+        Args:
+            source_id: Source ID to start a processor for
+        """
+        self.running = True
+        
+        with self.metrics_lock:
+            self.processed_logs_count.setdefault(source_id, 0)
+            self.last_processed_timestamp.setdefault(source_id, None)
+        
+        self._ensure_processor(source_id)
+        logger.info(f"Started processor for source {source_id}")
+    
+    def update_source(self, source_id):
+        """Apply a configuration change to a source.
+        
+        Workers re-read their source configuration on every iteration, so
+        this only needs to make sure a processor is running.
+        
+        Args:
+            source_id: Source ID that was updated
+        """
+        self.add_source(source_id)
+    
+    def remove_source(self, source_id):
+        """Stop the processors of a deleted source.
+        
+        Signals the source's workers to exit and drops their bookkeeping
+        without waiting; each worker finishes within one queue poll.
+        
+        Args:
+            source_id: Source ID that was deleted
+        """
+        prefix = f"{source_id}:"
+        with self.lock:
+            for p_id in [p_id for p_id in self.processors if p_id.startswith(prefix)]:
+                del self.processors[p_id]
+            self.queues.pop(source_id, None)
+            stop_event = self.stop_events.pop(source_id, None)
+        
+        if stop_event is not None:
+            stop_event.set()
+        
+        logger.info(f"Stopping processors for source {source_id}")
+    
     def update_processors(self):
         """Update processors based on current source configuration."""
         with self.lock:
@@ -121,45 +178,62 @@ class ProcessorManager:
             # Start processors again with updated configuration
             self.start()
     
-    def _ensure_processor(self, source_id):
+    def _ensure_processor(self, source_id, create=True):
         """Ensure a processor exists for the given source.
         
         Args:
             source_id: Source ID to create processor for
+            create: Set the source up if it has no queue yet; when False only
+                a dead main worker of an already running source is restarted
+            
+        Returns:
+            queue.Queue: The source's queue, or None if create is False and
+            the source is not being processed
         """
         with self.lock:
-            # Create queue if needed
+            # Create queue and stop event if needed
             if source_id not in self.queues:
+                if not create:
+                    return None
                 self.queues[source_id] = queue.Queue()
+            if source_id not in self.stop_events:
+                self.stop_events[source_id] = threading.Event()
             
             # Create processor thread if needed
             processor_id = f"{source_id}:main"
             if processor_id not in self.processors or not self.processors[processor_id].is_alive():
                 thread = threading.Thread(
                     target=self._processor_worker,
-                    args=(processor_id, source_id),
+                    args=(processor_id, source_id, self.queues[source_id], self.stop_events[source_id]),
                     daemon=True
                 )
                 self.processors[processor_id] = thread
                 thread.start()
+            
+            return self.queues[source_id]
     
-    def _processor_worker(self, processor_id, source_id):
+    def _processor_worker(self, processor_id, source_id, source_queue, stop_event):
         """Worker thread for processing logs.
         
         Args:
             processor_id: Unique identifier for this processor thread
             source_id: Source ID this processor handles
+            source_queue: Queue of raw logs for the source
+            stop_event: Event set when the source is removed
         """
         logger.info(f"Starting processor {processor_id} for source {source_id}")
         last_activity_time = time.time()  # Track when we last received a log
         batch = []  # Keep batch state between iterations
         
-        while self.running:
+        while self.running and not stop_event.is_set():
             try:
                 # Get source configuration
                 source = self.source_manager.get_source(source_id)
                 if not source:
-                    logger.error(f"Source {source_id} not found, stopping processor")
+                    # Sources are deleted just before remove_source() signals
+                    # their workers, so only a missing signal is an error
+                    if not stop_event.wait(1.0):
+                        logger.error(f"Source {source_id} not found, stopping processor")
                     break
                 
                 # Get batch size
@@ -206,17 +280,17 @@ class ProcessorManager:
                         wait_time = 0.5  # Standard wait
                     
                     # Get a log if available
-                    log_str = self.queues[source_id].get(timeout=wait_time)
+                    log_str = source_queue.get(timeout=wait_time)
                     batch.append(log_str)
-                    self.queues[source_id].task_done()
+                    source_queue.task_done()
                     last_activity_time = time.time()  # Update activity timestamp
                     
                     # Try to get more logs without blocking (drain queue up to batch size)
                     while len(batch) < batch_size:
                         try:
-                            log_str = self.queues[source_id].get_nowait()
+                            log_str = source_queue.get_nowait()
                             batch.append(log_str)
-                            self.queues[source_id].task_done()
+                            source_queue.task_done()
                         except queue.Empty:
                             break
                     
@@ -3,10 +3,14 @@ Source manager module for handling log sources configuration.
 Provides functionality to create, update, and validate sources.
 """
 import os
+import stat
+import atexit
 import uuid
 import time
-import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
 from log_collector.config import (
@@ -18,11 +22,52 @@ from log_collector.config import (
     DEFAULT_FOLDER_BATCH_SIZE,
 )
 
+# Shared session so repeated HEC checks reuse pooled keep-alive connections;
+# no retries, so a bad HEC URL fails once instead of hanging the UI
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=0))
+_HTTP.mount("http://", _HTTP_ADAPTER)
+_HTTP.mount("https://", _HTTP_ADAPTER)
+
+# (connect, read) timeouts in seconds for the HEC connection test
+_HEC_TIMEOUT = (3, 10)
+
+# Seconds to wait for further changes before writing sources to disk
+_SAVE_DELAY = 0.25
+
+def _uuid4():
+    """Generate a random UUID4 string straight from os.urandom."""
+    return str(uuid.UUID(bytes=os.urandom(16), version=4))
+
 class SourceManager:
     """Manages log sources configuration and validation."""
     
     def __init__(self):
         self.sources = load_sources()
+        
+        # source_ip -> source_id, kept in sync by the mutators below
+        self.ip_index = {source["source_ip"]: source_id for source_id, source in self.sources.items()}
+        
+        # (protocol, port) -> IDs of the sources sharing that listener
+        self._by_listener = {}
+        for source_id, source in self.sources.items():
+            self._index_listener(source_id, source)
+        
+        # Bumped on every change so callers can cache views of the sources
+        self.version = 0
+        
+        # Debounced persistence: mutators mark the sources dirty and a timer
+        # writes them once changes stop arriving
+        self._dirty = False
+        self._flush_timer = None
+        self._save_lock = threading.Lock()
+        
+        # Set when the last save failed, cleared by the next successful one
+        self.save_error = None
+        
+        # The save timer is a daemon thread, so write pending changes on any
+        # interpreter exit, not just the CLI's clean shutdown
+        atexit.register(self.flush)
     
     def get_sources(self):
         """Get all configured sources."""
@@ -32,10 +77,46 @@ class SourceManager:
         """Get a specific source by ID."""
         return self.sources.get(source_id)
     
+    def has_ip(self, source_ip, exclude_id=None):
+        """Check if a source IP is already used by a source.
+        
+        Args:
+            source_ip: IP address to look up
+            exclude_id: Source ID to ignore (e.g. the source being edited)
+        """
+        owner = self.ip_index.get(source_ip)
+        return owner is not None and owner != exclude_id
+    
+    def get_sources_by_listener(self, protocol, port):
+        """Get the IDs of the sources served by a listener.
+        
+        Args:
+            protocol: Listener protocol (UDP or TCP)
+            port: Listener port
+            
+        Returns:
+            set: Source IDs, empty if none; must not be modified
+        """
+        return self._by_listener.get((protocol, int(port)), set())
+    
+    def _index_listener(self, source_id, source):
+        """Add a source to the listener index."""
+        key = (source["protocol"], int(source["listener_port"]))
+        self._by_listener.setdefault(key, set()).add(source_id)
+    
+    def _unindex_listener(self, source_id, source):
+        """Remove a source from the listener index."""
+        key = (source["protocol"], int(source["listener_port"]))
+        source_ids = self._by_listener.get(key)
+        if source_ids is not None:
+            source_ids.discard(source_id)
+            if not source_ids:
+                del self._by_listener[key]
+    
     def add_source(self, source_data):
         """Add a new log source."""
         # Generate a unique ID for the source
-        source_id = str(uuid.uuid4())
+        source_id = _uuid4()
         
         # Set default values if not provided
         if "protocol" not in source_data:
@@ -47,12 +128,12 @@ class SourceManager:
             source_data["batch_size"] = DEFAULT_FOLDER_BATCH_SIZE
         
         # Check if IP is already in use
-        for existing_id, existing_source in self.sources.items():
-            if existing_source["source_ip"] == source_data["source_ip"]:
-                return {
-                    "success": False,
-                    "error": f"IP address {source_data['source_ip']} is already used by source '{existing_source['source_name']}'"
-                }
+        if self.has_ip(source_data["source_ip"]):
+            existing_source = self.sources[self.ip_index[source_data["source_ip"]]]
+            return {
+                "success": False,
+                "error": f"IP address {source_data['source_ip']} is already used by source '{existing_source['source_name']}'"
+            }
         
         # Validate the source before adding
         validation_result = self.validate_source(source_data)
@@ -64,20 +145,17 @@ class SourceManager:
         
         # Add the source to the collection
         self.sources[source_id] = source_data
+        self.ip_index[source_data["source_ip"]] = source_id
+        self._index_listener(source_id, source_data)
+        self.version += 1
         
         # Save the updated sources
-        if save_sources(self.sources):
-            logger.info(f"Added new source: {source_data['source_name']} (ID: {source_id})")
-            return {
-                "success": True,
-                "source_id": source_id
-            }
-        else:
-            logger.error(f"Failed to save source: {source_data['source_name']}")
-            return {
-                "success": False,
-                "error": "Failed to save source configuration"
-            }
+        self._schedule_save()
+        logger.info(f"Added new source: {source_data['source_name']} (ID: {source_id})")
+        return {
+            "success": True,
+            "source_id": source_id
+        }
     
     def update_source(self, source_id, updated_data):
         """Update an existing log source."""
@@ -94,12 +172,12 @@ class SourceManager:
         # Check if updated IP is already in use by another source
         if "source_ip" in updated_data:
             new_ip = updated_data["source_ip"]
-            for existing_id, existing_source in self.sources.items():
-                if existing_id != source_id and existing_source["source_ip"] == new_ip:
-                    return {
-                        "success": False,
-                        "error": f"IP address {new_ip} is already used by source '{existing_source['source_name']}'"
-                    }
+            if self.has_ip(new_ip, exclude_id=source_id):
+                existing_source = self.sources[self.ip_index[new_ip]]
+                return {
+                    "success": False,
+                    "error": f"IP address {new_ip} is already used by source '{existing_source['source_name']}'"
+                }
         
         # Validate the updated source
         validation_result = self.validate_source(source_data)
@@ -110,20 +188,21 @@ class SourceManager:
             }
         
         # Update the source
+        old_source = self.sources[source_id]
         self.sources[source_id] = source_data
+        if old_source["source_ip"] != source_data["source_ip"]:
+            self.ip_index.pop(old_source["source_ip"], None)
+            self.ip_index[source_data["source_ip"]] = source_id
+        self._unindex_listener(source_id, old_source)
+        self._index_listener(source_id, source_data)
+        self.version += 1
         
         # Save the updated sources
-        if save_sources(self.sources):
-            logger.info(f"Updated source: {source_data['source_name']} (ID: {source_id})")
-            return {
-                "success": True
-            }
-        else:
-            logger.error(f"Failed to update source: {source_data['source_name']}")
-            return {
-                "success": False,
-                "error": "Failed to save source configuration"
-            }
+        self._schedule_save()
+        logger.info(f"Updated source: {source_data['source_name']} (ID: {source_id})")
+        return {
+            "success": True
+        }
     
     def delete_source(self, source_id):
         """Delete a log source."""
@@ -134,20 +213,81 @@ class SourceManager:
             }
         
         source_name = self.sources[source_id]["source_name"]
+        self.ip_index.pop(self.sources[source_id]["source_ip"], None)
+        self._unindex_listener(source_id, self.sources[source_id])
         del self.sources[source_id]
+        self.version += 1
         
         # Save the updated sources
-        if save_sources(self.sources):
-            logger.info(f"Deleted source: {source_name} (ID: {source_id})")
-            return {
-                "success": True
-            }
-        else:
-            logger.error(f"Failed to delete source: {source_name}")
+        self._schedule_save()
+        logger.info(f"Deleted source: {source_name} (ID: {source_id})")
+        return {
+            "success": True
+        }
+    
+    def _schedule_save(self):
+        """Mark sources dirty and (re)start the debounce timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_SAVE_DELAY, self._flush_sources)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_sources(self):
+        """Write sources to disk if they changed since the last save.
+        
+        Returns:
+            bool: False if the save failed, True otherwise
+        """
+        with self._save_lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return True
+            
+            if not save_sources(dict(self.sources)):
+                logger.error("Failed to save source configuration")
+                self.save_error = "Failed to save source configuration; changes are not on disk yet"
+                return False
+            
+            self._dirty = False
+            self.save_error = None
+            return True
+    
+    def flush(self):
+        """Write pending source changes immediately, e.g. on shutdown."""
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+        return self._flush_sources()
+    
+    def check_folder_writable(self, folder_path):
+        """Check that a folder accepts writes by creating and removing a test file.
+        
+        A real write is used because os.access misreports ACLs, network
+        shares and Windows folders.
+        
+        Args:
+            folder_path: Folder to check
+            
+        Returns:
+            dict: {"valid": True} or {"valid": False, "error": message}
+        """
+        try:
+            test_file = Path(folder_path) / ".test_write_access"
+            with open(test_file, "w") as f:
+                f.write("test")
+            os.remove(test_file)
+        except Exception as e:
             return {
-                "success": False,
-                "error": "Failed to save source configuration"
+                "valid": False,
+                "error": f"Folder is not writable: {str(e)}"
             }
+        
+        return {
+            "valid": True
+        }
     
     def validate_source(self, source_data):
         """Validate source configuration."""
@@ -162,19 +302,20 @@ class SourceManager:
                 }
         
         # Validate listener port
-        try:
-            port = int(source_data["listener_port"])
-            if port < 1 or port > 65535:
-                return {
-                    "valid": False,
-                    "error": "Listener port must be between 1 and 65535"
-                }
-        except ValueError:
+        port_str = str(source_data["listener_port"])
+        if not port_str.isdecimal():
             return {
                 "valid": False,
                 "error": "Listener port must be a valid number"
             }
         
+        port = int(port_str)
+        if port < 1 or port > 65535:
+            return {
+                "valid": False,
+                "error": "Listener port must be between 1 and 65535"
+            }
+        
         # Validate protocol
         if source_data.get("protocol") not in ["UDP", "TCP"]:
             return {
@@ -190,29 +331,32 @@ class SourceManager:
                     "error": "Folder path is required for Folder target"
                 }
             
-            # Check if folder exists and is accessible
+            # Check if folder exists and is accessible, creating it if missing
             folder_path = Path(source_data["folder_path"])
-            if not folder_path.exists():
+            abs_path = os.path.abspath(folder_path)
+            try:
+                st = os.stat(abs_path)
+            except OSError:
                 try:
-                    os.makedirs(folder_path, exist_ok=True)
+                    os.makedirs(abs_path, exist_ok=True)
+                    st = os.stat(abs_path)
                 except Exception as e:
                     return {
                         "valid": False,
                         "error": f"Could not create folder path: {str(e)}"
                     }
             
-            # Check if folder is writable
-            try:
-                test_file = folder_path / ".test_write_access"
-                with open(test_file, "w") as f:
-                    f.write("test")
-                os.remove(test_file)
-            except Exception as e:
+            if not stat.S_ISDIR(st.st_mode):
                 return {
                     "valid": False,
-                    "error": f"Folder is not writable: {str(e)}"
+                    "error": f"Folder path is not a directory: {abs_path}"
                 }
             
+            # Check if folder is writable
+            write_check = self.check_folder_writable(folder_path)
+            if not write_check["valid"]:
+                return write_check
+            
         elif source_data["target_type"] == "HEC":
             if "hec_url" not in source_data:
                 return {
@@ -240,15 +384,14 @@ class SourceManager:
                 token = source_data["hec_token"]
                 
                 headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "text/plain; charset=utf-8"
+                    "Authorization": f"Bearer {token}"
                 }
                 
-                response = requests.post(
+                response = _HTTP.post(
                     url,
-                    data=json.dumps(test_event),
+                    json=test_event,
                     headers=headers,
-                    timeout=10
+                    timeout=_HEC_TIMEOUT
                 )
                 
                 if response.status_code != 200:
@@ -256,6 +399,11 @@ class SourceManager:
                         "valid": False,
                         "error": f"HEC connection test failed with status code: {response.status_code}"
                     }
+            except requests.exceptions.ConnectTimeout:
+                return {
+                    "valid": False,
+                    "error": f"HEC connection test failed: connect timeout after {_HEC_TIMEOUT[0]} seconds"
+                }
             except Exception as e:
                 return {
                     "valid": False,